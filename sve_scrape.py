@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
+import asyncio
 import csv
+import json
+import multiprocessing
 import os
 import re
+import sqlite3
 import sys
 import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Set
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+import aiohttp
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 
 
@@ -23,47 +33,170 @@ UA = (
     "Chrome/124.0.0.0 Safari/537.36"
 )
 
+HEADERS = {
+    "User-Agent": UA,
+    "Accept-Language": "ja,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Referer": INDEX_URL,
+}
+
+# Statuses retried with backoff (shared by the requests and aiohttp clients)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Statuses meaning the server wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+# On-disk HTTP cache for the requests session (index/listing/inspect pages)
+CACHE_PATH = "sve_cache.sqlite"
+CACHE_EXPIRE_SEC = 3600
+
 
-def session_with_retries() -> requests.Session:
+def session_with_retries(cache_path: Optional[str] = CACHE_PATH) -> requests.Session:
     from requests.adapters import HTTPAdapter
     from urllib3.util.retry import Retry
 
-    s = requests.Session()
-    s.headers.update(
-        {
-            "User-Agent": UA,
-            "Accept-Language": "ja,en;q=0.9",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Referer": INDEX_URL,
-        }
-    )
+    s: Optional[requests.Session] = None
+    if cache_path:
+        try:
+            from requests_cache import CachedSession
+
+            # Expired entries are revalidated with ETag/Last-Modified, so 304s cost no body
+            s = CachedSession(
+                cache_path,
+                backend="sqlite",
+                expire_after=CACHE_EXPIRE_SEC,
+                allowable_methods=("GET",),
+            )
+        except ImportError:
+            print("[warn] requests-cache is not installed; HTTP cache disabled", file=sys.stderr)
+    if s is None:
+        s = requests.Session()
+    s.headers.update(HEADERS)
+    s.headers["Connection"] = "keep-alive"
 
     retries = Retry(
         total=5,
         backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
+        status_forcelist=list(RETRY_STATUSES),
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.mount("http://", HTTPAdapter(max_retries=retries))
+    # Larger pool so every request to the site reuses a warm TLS connection
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=32, pool_maxsize=64, pool_block=False)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     return s
 
 
-def get_soup(s: requests.Session, url: str, *, timeout: float = 15.0) -> BeautifulSoup:
+@lru_cache(maxsize=None)
+def _html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    try:
+        return lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # Charset label libxml2 does not know (e.g. x-sjis): fall back to the meta charset
+        return lxml.html.HTMLParser()
+
+
+def parse_html(html: bytes, encoding: Optional[str] = None) -> lxml.html.HtmlElement:
+    """Parse a full page or a cardsearch_ex fragment into an lxml tree.
+
+    The raw body is decoded by lxml itself, using `encoding` or else the page's meta charset.
+    """
+    if not html.strip():
+        return lxml.html.document_fromstring("<html></html>")
+    return lxml.html.document_fromstring(html, parser=_html_parser(encoding))
+
+
+def _retry_after_sec(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class AdaptiveDelay:
+    """AIMD pacing between listing requests.
+
+    The delay doubles (or jumps to Retry-After) whenever the server throttles us and
+    shrinks by `step` after each healthy response, down to `min_delay`. There is no wait
+    after a response served from the local HTTP cache.
+    """
+
+    delay: float
+    min_delay: float = 0.05
+    max_delay: float = 30.0
+    step: float = 0.05
+    _from_cache: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Never wait longer on a healthy server than the user asked for
+        self.min_delay = min(self.min_delay, self.delay)
+
+    def observe(self, r: requests.Response) -> None:
+        # Cache hits never reached the server (revalidated entries did)
+        self._from_cache = getattr(r, "from_cache", False) and not getattr(r, "revalidated", False)
+        if self._from_cache:
+            return
+        # The Retry adapter absorbs 429/503s, so also look at the retries it made
+        history = getattr(getattr(r.raw, "retries", None), "history", None) or ()
+        throttled = r.status_code in THROTTLE_STATUSES or any(h.status in THROTTLE_STATUSES for h in history)
+        retry_after = _retry_after_sec(r.headers.get("Retry-After"))
+        if throttled or retry_after is not None or r.headers.get("X-RateLimit-Remaining") == "0":
+            self.delay = min(self.max_delay, max(self.delay * 2, self.step, retry_after or 0.0))
+        else:
+            self.delay = max(self.min_delay, self.delay - self.step)
+
+    def wait(self) -> None:
+        if not self._from_cache:
+            time.sleep(self.delay)
+
+
+def _pacer(delay: Union[float, AdaptiveDelay]) -> AdaptiveDelay:
+    # Callers may pass a shared pacer so the learned delay carries across crawls
+    return delay if isinstance(delay, AdaptiveDelay) else AdaptiveDelay(delay)
+
+
+def get_page(
+    s: requests.Session, url: str, *, timeout: float = 15.0, pace: Optional[AdaptiveDelay] = None
+) -> requests.Response:
     r = s.get(url, timeout=timeout)
+    if pace is not None:
+        pace.observe(r)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "lxml")
+    return r
+
+
+def response_tree(r: requests.Response) -> lxml.html.HtmlElement:
+    # Parse the raw body directly; r.text would decode the whole page in Python first
+    return parse_html(r.content, r.encoding)
+
 
+def get_tree(s: requests.Session, url: str, *, timeout: float = 15.0) -> lxml.html.HtmlElement:
+    return response_tree(get_page(s, url, timeout=timeout))
 
-def extract_expansions(soup: BeautifulSoup) -> List[str]:
+
+# Listing-page navigation is evaluated with precompiled XPath so traversal stays in C
+_EXSLT_NS = {"re": "http://exslt.org/regular-expressions"}
+_EXPANSION_XP = etree.XPath("(//select[@name='expansion_name'])[1]//option/@value")
+_NEXT_REL_XP = etree.XPath("//a[re:test(@rel, 'next', 'i')]", namespaces=_EXSLT_NS)
+# Anchor text containing 次(へ) / Next / » / >>
+_NEXT_TEXT_XP = etree.XPath(
+    "//a[@href != ''][contains(., '次') or contains(., 'Next') or contains(., '»') or contains(., '>>')]/@href"
+)
+
+
+def extract_expansions(tree: lxml.html.HtmlElement) -> List[str]:
     """Extract expansion codes from the search form's select[name=expansion_name]."""
     codes: List[str] = []
-    sel = soup.select_one('select[name="expansion_name"]')
-    if not sel:
-        return codes
-    for opt in sel.find_all("option"):
-        val = (opt.get("value") or "").strip()
+    for val in _EXPANSION_XP(tree):
+        val = val.strip()
         if val and val.upper() != "ALL":
             codes.append(val)
     return codes
@@ -71,64 +204,70 @@ def extract_expansions(soup: BeautifulSoup) -> List[str]:
 
 # Include lowercase and underscore as some cardnos use suffixes like 'a'/'b'
 CARDNO_RE = re.compile(r"cardno=([A-Za-z0-9_\-]+)")
+# Same pattern for raw response bodies; cardnos are ASCII, so no decode is needed
+_CARDNO_RE_BYTES = re.compile(rb"cardno=([A-Za-z0-9_\-]+)")
+# cardsearch pages expose their page count in an inline script
+_MAX_PAGE_RE = re.compile(rb"max_page\s*=\s*(\d+)")
+_QS_INDEX_RE = re.compile(r"\[0\]$")
+_CARDNO_HREF_XP = etree.XPath("//a[contains(@href, 'cardno=')]/@href")
+
+
+def extract_cardnos_from_html(html: bytes) -> Set[str]:
+    found = {m.decode("ascii") for m in _CARDNO_RE_BYTES.findall(html)}
+    return found
 
 
-def extract_cardnos_from_html(html: str) -> Set[str]:
-    found = set(CARDNO_RE.findall(html))
+def extract_cardnos_from_tree(tree: lxml.html.HtmlElement) -> Set[str]:
+    # For pages that are parsed anyway (e.g. to find the next link): only card link hrefs are scanned
+    found: Set[str] = set()
+    for href in _CARDNO_HREF_XP(tree):
+        m = CARDNO_RE.search(href)
+        if m:
+            found.add(m.group(1))
     return found
 
 
-def find_next_url(soup: BeautifulSoup, current_url: str) -> Optional[str]:
+def find_next_url(tree: lxml.html.HtmlElement, current_url: str) -> Optional[str]:
     # 1) rel=next
-    a = soup.find("a", attrs={"rel": re.compile("next", re.I)})
-    if a and a.get("href"):
-        return urljoin(current_url, a["href"])
-
-    # 2) text contains 次 or Next or »
-    for a in soup.find_all("a"):
-        txt = (a.get_text(strip=True) or "")
-        if any(t in txt for t in ["次へ", "次", "Next", "»", ">>"]):
-            href = a.get("href")
-            if href:
-                return urljoin(current_url, href)
-
-    # 3) pagination container heuristic
-    nav = soup.find(class_=re.compile("page|pager|pagination", re.I))
-    if nav:
-        for a in nav.find_all("a"):
-            txt = (a.get_text(strip=True) or "")
-            if any(t in txt for t in ["次へ", "次", "Next", "»", ">>"]):
-                href = a.get("href")
-                if href:
-                    return urljoin(current_url, href)
+    rel_next = _NEXT_REL_XP(tree)
+    if rel_next and rel_next[0].get("href"):
+        return urljoin(current_url, rel_next[0].get("href"))
+
+    # 2) text contains 次 or Next or » (this also covers links inside pager containers)
+    hrefs = _NEXT_TEXT_XP(tree)
+    if hrefs:
+        return urljoin(current_url, str(hrefs[0]))
 
     return None
 
 
-def crawl_cardnos_for_expansion(s: requests.Session, expansion: str, delay: float = 0.8) -> Set[str]:
+def crawl_cardnos_for_expansion(
+    s: requests.Session, expansion: str, delay: Union[float, AdaptiveDelay] = 0.8
+) -> Set[str]:
     params = {"expansion_name": expansion, "class[]": "all"}
     url = f"{SEARCH_URL}?{urlencode(params, doseq=True)}"
     cardnos: Set[str] = set()
+    pace = _pacer(delay)
 
     while url:
-        soup = get_soup(s, url)
-        html = str(soup)
-        found = extract_cardnos_from_html(html)
+        r = get_page(s, url, pace=pace)
+        found = extract_cardnos_from_html(r.content)
         cardnos.update(found)
-        nxt = find_next_url(soup, url)
+        nxt = find_next_url(response_tree(r), url)
         if nxt and nxt != url:
             url = nxt
-            time.sleep(delay)
+            pace.wait()
         else:
             break
 
     return cardnos
 
 
-def crawl_all_cardnos(s: requests.Session, delay: float = 0.8) -> Set[str]:
+def crawl_all_cardnos(s: requests.Session, delay: Union[float, AdaptiveDelay] = 0.8) -> Set[str]:
+    pace = _pacer(delay)
     # Load index to get expansions
-    soup = get_soup(s, INDEX_URL)
-    expansions = extract_expansions(soup)
+    tree = get_tree(s, INDEX_URL)
+    expansions = extract_expansions(tree)
     if not expansions:
         # Fallback: try an unfiltered search page
         expansions = [""]
@@ -136,83 +275,85 @@ def crawl_all_cardnos(s: requests.Session, delay: float = 0.8) -> Set[str]:
     all_cardnos: Set[str] = set()
     for exp in expansions:
         try:
-            batch = crawl_cardnos_for_expansion(s, exp, delay=delay)
+            batch = crawl_cardnos_for_expansion(s, exp, delay=pace)
             all_cardnos.update(batch)
         except Exception as e:
             print(f"[warn] expansion {exp}: {e}", file=sys.stderr)
     return all_cardnos
 
 
-def crawl_cardnos_from_search_url(s: requests.Session, url: str, delay: float = 0.8) -> Set[str]:
+def _normalize_qs(parsed) -> Dict[str, List[str]]:
+    """Return the query of a search URL for cardsearch_ex requests.
+
+    Keys like class[0] (as produced by the cardlist form) are normalized to class[].
+    """
+    normalized_qs: Dict[str, List[str]] = {}
+    for k, v in parse_qs(parsed.query, keep_blank_values=True).items():
+        normalized_qs.setdefault(_QS_INDEX_RE.sub("[]", k), v)
+    return normalized_qs
+
+
+def crawl_cardnos_from_search_url(
+    s: requests.Session, url: str, delay: Union[float, AdaptiveDelay] = 0.8
+) -> Set[str]:
     """Crawl a full search URL (cardlist or cardsearch) and collect cardnos across pagination.
 
     Supports both classic pagination and the site's infinite scroll (cardsearch_ex) endpoints.
     """
     cardnos: Set[str] = set()
+    pace = _pacer(delay)
 
     # Fetch first page
-    soup = get_soup(s, url)
-    html = str(soup)
-    cardnos.update(extract_cardnos_from_html(html))
+    r = get_page(s, url, pace=pace)
 
     # Detect infinite-scroll style (cardsearch) with ajax subpages
     parsed = urlparse(url)
     if "/cardlist/cardsearch/" in parsed.path:
+        cardnos.update(extract_cardnos_from_html(r.content))
         # Try to find max_page from inline script
-        m = re.search(r"max_page\s*=\s*(\d+)", html)
+        m = _MAX_PAGE_RE.search(r.content)
         max_page = int(m.group(1)) if m else 1
         # Build base ex URL with same query
-        qs = parse_qs(parsed.query, keep_blank_values=True)
-        # Normalize keys like class[] that sometimes appear as class[0]
-        normalized_qs = {}
-        for k, v in qs.items():
-            nk = k.replace("class[0]", "class[]").replace("cost[0]", "cost[]").replace("card_kind[0]", "card_kind[]")
-            normalized_qs.setdefault(nk, v)
+        normalized_qs = _normalize_qs(parsed)
         base_ex = urljoin(url, "/cardlist/cardsearch_ex")
         for page in range(2, max_page + 1):
             normalized_qs["page"] = [str(page)]
             ex_url = f"{base_ex}?{urlencode(normalized_qs, doseq=True)}"
             try:
-                ex_soup = get_soup(s, ex_url)
-                ex_html = str(ex_soup)
-                cardnos.update(extract_cardnos_from_html(ex_html))
-                time.sleep(delay)
+                # cardnos come from a regex over the body; no tree is needed here
+                cardnos.update(extract_cardnos_from_html(get_page(s, ex_url, pace=pace).content))
+                pace.wait()
             except Exception as e:
                 print(f"[warn] search_ex page {page}: {e}", file=sys.stderr)
         return cardnos
 
-    # Otherwise, try classic pagination links
-    next_url = find_next_url(soup, url)
-    while next_url and next_url != url:
-        soup = get_soup(s, next_url)
-        html = str(soup)
-        cardnos.update(extract_cardnos_from_html(html))
-        url = next_url
-        next_url = find_next_url(soup, url)
-        if next_url and next_url != url:
-            time.sleep(delay)
+    # Otherwise, try classic pagination links. Each page is parsed once and the tree
+    # serves both the cardno links and the next link. The next page is requested in
+    # the background as soon as its URL is known, so the fetch overlaps with parsing.
+    def fetch_next(u: str) -> requests.Response:
+        pace.wait()
+        return get_page(s, u, pace=pace)
+
+    tree = response_tree(r)
+    cardnos.update(extract_cardnos_from_tree(tree))
+    next_url = find_next_url(tree, url)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        fut = pool.submit(fetch_next, next_url) if next_url and next_url != url else None
+        while fut is not None:
+            tree = response_tree(fut.result())
+            url = next_url
+            next_url = find_next_url(tree, url)
+            fut = pool.submit(fetch_next, next_url) if next_url and next_url != url else None
+            cardnos.update(extract_cardnos_from_tree(tree))
     return cardnos
 
 
-def _all_links_and_datacardnos(soup: BeautifulSoup) -> Dict[str, List[str]]:
-    """Collect all hrefs and any data-cardno attributes on the page for diagnostics.
+_HREF_XP = etree.XPath("//a/@href")
 
-    Returns a dict with keys:
-    - hrefs: list of href strings
-    - data_cardnos: list of values from any [data-cardno] attributes
-    """
-    hrefs: List[str] = []
-    for a in soup.find_all('a', href=True):
-        hrefs.append(a['href'])
-    data_cardnos: List[str] = []
-    for el in soup.select('[data-cardno]'):
-        val = (el.get('data-cardno') or '').strip()
-        if val:
-            data_cardnos.append(val)
-    return {"hrefs": hrefs, "data_cardnos": data_cardnos}
-
-
-def inspect_search_url(s: requests.Session, url: str, delay: float = 0.8, sample: int = 5) -> Dict[str, object]:
+
+def inspect_search_url(
+    s: requests.Session, url: str, delay: Union[float, AdaptiveDelay] = 0.8, sample: int = 5
+) -> Dict[str, object]:
     """Inspect a search URL and report examples of:
     - Duplicate cardno occurrences across listing entries
     - Listing links that do not contain a `cardno=` parameter
@@ -226,32 +367,31 @@ def inspect_search_url(s: requests.Session, url: str, delay: float = 0.8, sample
         "pages": 0,
     }
 
+    pace = _pacer(delay)
+
     # Fetch first page
-    soup = get_soup(s, url)
-    html = str(soup)
+    r = get_page(s, url, pace=pace)
+    tree = response_tree(r)
     parsed = urlparse(url)
 
     # Helper to process a single page
-    def process_page(soup: BeautifulSoup, base_url: str):
-        html = str(soup)
-        hrefs_data = _all_links_and_datacardnos(soup)
-        hrefs = [urljoin(base_url, h) for h in hrefs_data["hrefs"]]
-        found_cardnos = list(CARDNO_RE.findall(html))
-
-        # Count occurrences per cardno and retain sample hrefs for that cardno
-        hrefs_by_cardno: Dict[str, List[str]] = {}
-        for h in hrefs:
-            m = CARDNO_RE.search(h)
+    def process_page(tree: lxml.html.HtmlElement, base_url: str):
+        # Single pass over the links: count links per cardno (keeping up to 3 sample
+        # hrefs each) and collect links under the cardlist domain without cardno param
+        acc: Dict[str, list] = {}
+        no_param: List[str] = []
+        for h in _HREF_XP(tree):
+            absu = urljoin(base_url, h)
+            m = CARDNO_RE.search(absu)
             if m:
-                hrefs_by_cardno.setdefault(m.group(1), []).append(h)
-
-        from collections import Counter
-        cnt = Counter(found_cardnos)
-        dups = [(cn, n, hrefs_by_cardno.get(cn, [])[:3]) for cn, n in cnt.items() if n > 1]
-
-        # Links under cardlist domain without cardno param
-        no_param = [h for h in hrefs if "/cardlist/" in h and "cardno=" not in h]
-
+                rec = acc.setdefault(m.group(1), [0, []])
+                rec[0] += 1
+                if len(rec[1]) < 3:
+                    rec[1].append(absu)
+            elif "/cardlist/" in absu and "cardno=" not in absu:
+                no_param.append(absu)
+
+        dups = [(cn, n, samples) for cn, (n, samples) in acc.items() if n > 1]
         return dups, no_param
 
     # Determine pagination style
@@ -259,49 +399,46 @@ def inspect_search_url(s: requests.Session, url: str, delay: float = 0.8, sample
     no_param_accum: List[str] = []
 
     if "/cardlist/cardsearch/" in parsed.path:
-        m = re.search(r"max_page\s*=\s*(\d+)", html)
+        m = _MAX_PAGE_RE.search(r.content)
         max_page = int(m.group(1)) if m else 1
         # First page
-        d, np = process_page(soup, url)
+        d, np = process_page(tree, url)
         duplicates_accum.extend(d)
         no_param_accum.extend(np)
         # Subsequent pages via cardsearch_ex
-        qs = parse_qs(parsed.query, keep_blank_values=True)
-        normalized_qs = {}
-        for k, v in qs.items():
-            nk = k.replace("class[0]", "class[]").replace("cost[0]", "cost[]").replace("card_kind[0]", "card_kind[]")
-            normalized_qs.setdefault(nk, v)
+        normalized_qs = _normalize_qs(parsed)
         base_ex = urljoin(url, "/cardlist/cardsearch_ex")
         for page in range(2, max_page + 1):
             normalized_qs["page"] = [str(page)]
             ex_url = f"{base_ex}?{urlencode(normalized_qs, doseq=True)}"
             try:
-                ex_soup = get_soup(s, ex_url)
-                d, np = process_page(ex_soup, ex_url)
+                ex_r = get_page(s, ex_url, pace=pace)
+                d, np = process_page(response_tree(ex_r), ex_url)
                 duplicates_accum.extend(d)
                 no_param_accum.extend(np)
-                time.sleep(delay)
+                pace.wait()
             except Exception:
                 pass
         results["pages"] = max_page
     else:
         # Classic pagination
         current_url = url
-        d, np = process_page(soup, current_url)
+        d, np = process_page(tree, current_url)
         duplicates_accum.extend(d)
         no_param_accum.extend(np)
-        next_url = find_next_url(soup, current_url)
+        next_url = find_next_url(tree, current_url)
         pages = 1
         while next_url and next_url != current_url:
-            soup = get_soup(s, next_url)
-            d, np = process_page(soup, next_url)
+            r = get_page(s, next_url, pace=pace)
+            tree = response_tree(r)
+            d, np = process_page(tree, next_url)
             duplicates_accum.extend(d)
             no_param_accum.extend(np)
             pages += 1
             current_url = next_url
-            next_url = find_next_url(soup, current_url)
+            next_url = find_next_url(tree, current_url)
             if next_url and next_url != current_url:
-                time.sleep(delay)
+                pace.wait()
         results["pages"] = pages
 
     # Prepare samples
@@ -349,6 +486,13 @@ LABEL_MAP = {
     "イラストレーター": "illustrator",
 }
 
+# Labels compared without whitespace and colons, e.g. "カード種類 ：" -> "カード種類"
+_LABEL_STRIP_RE = re.compile(r"\s|:|：")
+_LABEL_MAP_SIMPLE = {_LABEL_STRIP_RE.sub("", jp): en for jp, en in LABEL_MAP.items()}
+
+_WS_RE = re.compile(r"[\t\r\f\v ]+")
+_NUM_RE = re.compile(r"(\d+)")
+
 
 CANON_COLS = [
     "cardno",
@@ -370,66 +514,121 @@ CANON_COLS = [
 ]
 
 
-def extract_details_from_detail_page(soup: BeautifulSoup) -> Dict[str, str]:
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Detail-page lookups, compiled once. Candidate tuples are tried in priority order.
+# Card-specific name/image blocks are matched by one union query each (first hit in
+# document order); the generic selectors stay separate, lower-priority fallbacks.
+_NAME_XP = etree.XPath(
+    f"//*[{_has_class('cardlist-Detail')}]//h1[{_has_class('ttl')}]"
+    " | //*[{}]".format(
+        " or ".join(_has_class(c) for c in ("card-Detail_Name", "cardDetail-Name", "CardDetail_Name"))
+    )
+)
+# .Detail_Title ranks below the page's first <h1>, as it always has
+_DETAIL_TITLE_XP = etree.XPath(f"(//*[{_has_class('Detail_Title')}])[1]")
+_NAME_FALLBACK_XPS = (etree.XPath("(//h1)[1]"), _DETAIL_TITLE_XP)
+_IMAGE_XP = etree.XPath(
+    "//*[{}]//img | //img[{}]".format(
+        " or ".join(_has_class(c) for c in ("card-Detail_Image", "CardDetail_Image", "cardlist-Card_Image")),
+        _has_class("card-image"),
+    )
+)
+_IMAGE_FALLBACK_XP = etree.XPath("(//main//img)[1]")
+_DETAIL_BLOCK_XP = etree.XPath(f"(//*[{_has_class('detail')}])[1]")
+_ABILITY_BLOCK_XP = etree.XPath(
+    "(//*[{}])[1]".format(
+        " or ".join(_has_class(c) for c in ("Ability", "CardText", "card-Ability", "cardtext"))
+    )
+)
+_STATUS_XP = etree.XPath(f"(//*[{_has_class('status')}])[1]")
+_STATUS_ITEM_XPS = {
+    key: etree.XPath(f"(.//*[{_has_class(cls)}])[1]")
+    for key, cls in (
+        ("cost", "status-Item-Cost"),
+        ("power", "status-Item-Power"),
+        ("hp", "status-Item-Hp"),
+    )
+}
+# Any card-specific name block, including the .cardlist-Detail h1.ttl layout the site uses
+_DETAIL_NAME_BLOCK_XP = etree.XPath(f"boolean({_NAME_XP.path} | {_DETAIL_TITLE_XP.path})")
+_CARD_LINK_XP = etree.XPath(
+    f"(//*[{_has_class('cardlist-Card')} or {_has_class('CardList')}]//a | //a[{_has_class('card-link')}])[1]"
+)
+
+
+_TEXT_NODES_XP = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+
+def _text(el: lxml.html.HtmlElement, sep: str = "") -> str:
+    """Stripped, non-empty text nodes of `el` (outside <script>/<style>) joined with `sep`."""
+    return sep.join(t for t in (s.strip() for s in _TEXT_NODES_XP(el)) if t)
+
+
+def _block_text(el: lxml.html.HtmlElement) -> str:
+    """Raw text of a block with <img> replaced by its alt text and <br> by a newline.
+
+    <script>/<style> contents are skipped (their tails are kept).
+    """
+    parts = [el.text or ""]
+    for child in el:
+        if child.tag in ("script", "style"):
+            pass
+        elif child.tag == "img":
+            parts.append((child.get("alt") or "").strip())
+        elif child.tag == "br":
+            parts.append("\n")
+        elif isinstance(child.tag, str):
+            parts.append(_block_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _clean_ability_text(text: str) -> str:
+    # Normalize spaces but keep newlines inserted by <br>, then trim each line
+    text = _WS_RE.sub(' ', text)
+    return '\n'.join(ln.strip() for ln in text.split('\n'))
+
+
+def extract_details_from_detail_page(tree: lxml.html.HtmlElement) -> Dict[str, str]:
     data: Dict[str, str] = {}
 
-    # Name candidates
-    name_candidates = [
-        soup.select_one(".cardlist-Detail .txt > h1.ttl"),
-        soup.select_one(".cardlist-Detail h1.ttl"),
-        soup.select_one(".card-Detail_Name"),
-        soup.select_one(".cardDetail-Name"),
-        soup.select_one(".CardDetail_Name"),
-        soup.select_one("h1"),
-        soup.select_one(".Detail_Title"),
-    ]
-    for el in name_candidates:
-        if el and el.get_text(strip=True):
-            data.setdefault("name", el.get_text(strip=True))
+    # Name candidates; the generic queries only run if no card-specific block has text
+    for xp in (_NAME_XP, *_NAME_FALLBACK_XPS):
+        name = next(filter(None, map(_text, xp(tree))), "")
+        if name:
+            data.setdefault("name", name)
             break
 
-    # Main image (avoid site logo and unrelated images)
-    img = None
-    for sel in [
-        ".card-Detail_Image img",
-        ".CardDetail_Image img",
-        ".cardlist-Card_Image img",
-        "img.card-image",
-        "main img",
-    ]:
-        img = soup.select_one(sel)
-        if img and img.get("src"):
-            src = img.get("src")
-            # Skip common logo assets
-            if "logo" in src or "assets/images/common/logo" in src:
-                continue
+    # Main image (skip the site logo and other logo assets)
+    for xp in (_IMAGE_XP, _IMAGE_FALLBACK_XP):
+        src = next((u for u in (img.get("src") for img in xp(tree)) if u and "logo" not in u), None)
+        if src:
             data["image_url"] = urljoin(BASE, src)
             break
 
     # Definition lists (dt/dd)
-    for dl in soup.find_all("dl"):
-        dts = dl.find_all("dt")
-        dds = dl.find_all("dd")
+    for dl in tree.iter("dl"):
+        dts = dl.findall(".//dt")
+        dds = dl.findall(".//dd")
         if not dts or len(dts) != len(dds):
             continue
         for dt, dd in zip(dts, dds):
-            label = (dt.get_text(strip=True) or "").replace("：", ":").strip()
-            value = dd.get_text(" ", strip=True)
+            # Labels match without punctuation/spaces, so one lookup covers every spelling
+            key = _LABEL_MAP_SIMPLE.get(_LABEL_STRIP_RE.sub("", dt.text_content()))
+            if not key:
+                continue
+            value = _text(dd, " ")
             # If value is empty, sometimes numbers are expressed via <img alt="5">, etc.
             if not value:
-                alts = [i.get("alt", "").strip() for i in dd.find_all("img")]
+                alts = [i.get("alt", "").strip() for i in dd.iter("img")]
                 alts = [a for a in alts if a]
                 if alts:
                     value = " ".join(alts)
-            key = LABEL_MAP.get(label)
-            if not key:
-                # Try simplified matching without punctuation/spaces
-                simple = re.sub(r"\s|:|：", "", label)
-                for jp, en in LABEL_MAP.items():
-                    if simple == re.sub(r"\s|:|：", "", jp):
-                        key = en
-                        break
-            if key and value:
+            if value:
                 # If multiple entries exist, join with / but avoid duplicates
                 if key in data and value not in data[key]:
                     data[key] = f"{data[key]} / {value}"
@@ -437,59 +636,28 @@ def extract_details_from_detail_page(soup: BeautifulSoup) -> Dict[str, str]:
                     data[key] = value
 
     # Ability from primary detail block
-    detail_block = soup.select_one('.detail')
-    if detail_block:
-        # Replace icons with their alt text and preserve <br> as line breaks only
-        for img in detail_block.find_all('img'):
-            alt = (img.get('alt') or '').strip()
-            img.replace_with(alt if alt else '')
-        for br in detail_block.find_all('br'):
-            br.replace_with('\n')
-        text = detail_block.get_text()
-        # Normalize spaces but keep newlines inserted by <br>
-        text = re.sub(r'[\t\r\f\v ]+', ' ', text)
-        # Trim spaces around each line
-        lines = [ln.strip() for ln in text.split('\n')]
-        text = '\n'.join(lines)
+    found = _DETAIL_BLOCK_XP(tree)
+    if found:
+        text = _clean_ability_text(_block_text(found[0]))
         if text:
-            data['ability'] = text
+            data["ability"] = text
 
     # Ability might be in other blocks (fallback)
     if "ability" not in data:
-        ability_block = soup.select_one(".Ability, .CardText, .card-Ability, .cardtext")
-        if ability_block:
-            for img in ability_block.find_all('img'):
-                alt = (img.get('alt') or '').strip()
-                img.replace_with(alt if alt else '')
-            for br in ability_block.find_all('br'):
-                br.replace_with('\n')
-            text = ability_block.get_text()
-            text = re.sub(r'[\t\r\f\v ]+', ' ', text)
-            lines = [ln.strip() for ln in text.split('\n')]
-            text = '\n'.join(lines)
+        found = _ABILITY_BLOCK_XP(tree)
+        if found:
+            text = _clean_ability_text(_block_text(found[0]))
             if text:
                 data["ability"] = text
 
     # Status block for cost/power/hp (outside of dl)
-    status = soup.select_one('.status')
+    status = _STATUS_XP(tree)
     if status:
-        def _extract_number(sel: str) -> Optional[str]:
-            el = status.select_one(sel)
-            if not el:
-                return None
-            txt = el.get_text(strip=True)
-            m = re.search(r"(\d+)", txt)
-            return m.group(1) if m else None
-
-        cost = _extract_number('.status-Item-Cost')
-        power = _extract_number('.status-Item-Power')
-        hp = _extract_number('.status-Item-Hp')
-        if cost and not data.get('cost'):
-            data['cost'] = cost
-        if power and not data.get('power'):
-            data['power'] = power
-        if hp and not data.get('hp'):
-            data['hp'] = hp
+        for key, xp in _STATUS_ITEM_XPS.items():
+            found = xp(status[0])
+            m = _NUM_RE.search(_text(found[0])) if found else None
+            if m and not data.get(key):
+                data[key] = m.group(1)
 
     return data
 
@@ -499,84 +667,307 @@ def detail_url_for_cardno(cardno: str) -> str:
     return f"{INDEX_URL}?cardno={cardno}"
 
 
-def _looks_like_detail_page(soup: BeautifulSoup) -> bool:
-    # Heuristic: presence of known name blocks or definition list with expected labels
-    if soup.select_one(".card-Detail_Name, .cardDetail-Name, .CardDetail_Name, .Detail_Title"):
+def _looks_like_detail_page(tree: lxml.html.HtmlElement) -> bool:
+    # Heuristic: presence of known name blocks (one query, hits on real detail pages)
+    if _DETAIL_NAME_BLOCK_XP(tree):
         return True
-    for dt in soup.find_all("dt"):
-        txt = (dt.get_text(strip=True) or "").replace("：", ":").strip()
-        if txt in LABEL_MAP or re.sub(r"\s|:|：", "", txt) in {re.sub(r"\s|:|：", "", k) for k in LABEL_MAP}:
+    # Otherwise a definition list with expected labels; one strip + dict lookup per <dt>
+    for dt in tree.iter("dt"):
+        if _LABEL_STRIP_RE.sub("", dt.text_content()) in _LABEL_MAP_SIMPLE:
             return True
     return False
 
 
-def _find_detail_link_in_page(soup: BeautifulSoup, current_url: str, cardno: str) -> Optional[str]:
+def _find_detail_link_in_page(tree: lxml.html.HtmlElement, current_url: str, cardno: str) -> Optional[str]:
     # Prefer links that include the exact cardno
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for href in _HREF_XP(tree):
         if "cardno=" in href and cardno in href:
-            return urljoin(current_url, href)
+            return urljoin(current_url, str(href))
     # Try common list/detail link patterns
-    a = soup.select_one(".cardlist-Card a, .CardList a, a.card-link")
-    if a and a.get("href"):
-        return urljoin(current_url, a["href"])
+    found = _CARD_LINK_XP(tree)
+    if found and found[0].get("href"):
+        return urljoin(current_url, found[0].get("href"))
     return None
 
 
-def scrape_card_detail(s: requests.Session, cardno: str, delay: float = 0.6) -> Dict[str, str]:
-    # Try initial guess and fallbacks; resolve real detail page if needed
-    candidates = [
-        detail_url_for_cardno(cardno),
-        f"{SEARCH_URL}?{urlencode({'cardno': cardno, 'class[]': 'all'}, doseq=True)}",
-    ]
+def _parse_detail_html(
+    page: "FetchedPage", url: str, cardno: str, resolve: bool = True
+) -> Tuple[Dict[str, str], Optional[str]]:
+    """Parse a fetched detail candidate.
+
+    Returns (data, resolve_url). If the page does not look like a detail page but links
+    to a more specific one, data is empty and resolve_url is the link to follow.
+    """
+    tree = parse_html(page.html, page.encoding)
+    if resolve and not _looks_like_detail_page(tree):
+        nxt = _find_detail_link_in_page(tree, url, cardno)
+        if nxt:
+            return {}, nxt
+    return extract_details_from_detail_page(tree), None
+
+
+# Validators and bodies of detail pages from earlier runs (see ETagStore)
+ETAG_DB_PATH = "sve_etags.sqlite"
+
+
+class ETagStore:
+    """SQLite table of (cardno -> url, ETag, Last-Modified, html, charset) for conditional requests.
+
+    The detail page that produced a card is revalidated on the next run; a 304 reply
+    lets the card be re-parsed from the stored HTML without transferring the body.
+    """
+
+    def __init__(self, path: str, *, commit_every: int = 100):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            "cardno TEXT PRIMARY KEY, url TEXT, etag TEXT, last_mod TEXT, html BLOB, charset TEXT)"
+        )
+        self.commit_every = commit_every
+        self._pending = 0
+
+    def get(self, cardno: str) -> Optional[Tuple[str, Optional[str], Optional[str], bytes, Optional[str]]]:
+        return self.conn.execute(
+            "SELECT url, etag, last_mod, html, charset FROM meta WHERE cardno = ?", (cardno,)
+        ).fetchone()
+
+    def put(self, cardno: str, url: str, page: "FetchedPage") -> None:
+        if page.html is None or not (page.etag or page.last_modified):
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (cardno, url, etag, last_mod, html, charset) VALUES (?, ?, ?, ?, ?, ?)",
+            (cardno, url, page.etag, page.last_modified, page.html, page.encoding),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.conn.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+@dataclass
+class FetchedPage:
+    html: Optional[bytes]  # raw body; None when the server answered 304 Not Modified
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None  # charset from Content-Type, if any
+
+
+async def _fetch_page(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    retries: int = 5,
+    backoff: float = 0.5,
+) -> FetchedPage:
+    # Retry transient failures the same way session_with_retries() does for requests
+    for attempt in range(retries + 1):
+        last = attempt == retries
+        try:
+            async with session.get(url, headers=headers) as r:
+                if r.status not in RETRY_STATUSES or last:
+                    r.raise_for_status()
+                    # Keep the raw bytes: lxml decodes them (leniently) in the parser process
+                    html = None if r.status == 304 else await r.read()
+                    return FetchedPage(html, r.headers.get("ETag"), r.headers.get("Last-Modified"), r.charset)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last:
+                raise
+        await asyncio.sleep(backoff * (2 ** attempt))
+    raise RuntimeError("unreachable")
+
+
+async def fetch_detail(
+    session: aiohttp.ClientSession,
+    cardno: str,
+    sem: asyncio.Semaphore,
+    delay: float = 0.6,
+    executor: Optional[Executor] = None,
+    etags: Optional[ETagStore] = None,
+) -> Dict[str, str]:
+    loop = asyncio.get_running_loop()
     data: Dict[str, str] = {}
     final_url: Optional[str] = None
-    for u in candidates:
-        try:
-            soup = get_soup(s, u)
-        except Exception:
-            continue
-        if not _looks_like_detail_page(soup):
-            # Try to resolve a more specific detail link from this page
-            nxt = _find_detail_link_in_page(soup, u, cardno)
-            if nxt:
+    final_page: Optional[FetchedPage] = None
+    # Pages fetched for this card, by URL, so no candidate is ever downloaded twice
+    fetched: Dict[str, FetchedPage] = {}
+
+    async def _get(u: str) -> FetchedPage:
+        if u not in fetched:
+            fetched[u] = await _fetch_page(session, u)
+        return fetched[u]
+
+    async with sem:
+        cached = etags.get(cardno) if etags else None
+        if cached:
+            # Revalidate the page this card came from last time
+            cached_url, etag, last_mod, cached_html, cached_charset = cached
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_mod:
+                headers["If-Modified-Since"] = last_mod
+            try:
+                page = await _fetch_page(session, cached_url, headers=headers)
+                modified = page.html is not None
+                if not modified:
+                    page = FetchedPage(cached_html, page.etag or etag, page.last_modified or last_mod, cached_charset)
+                fetched[cached_url] = page
+                data, _ = await loop.run_in_executor(executor, _parse_detail_html, page, cached_url, cardno, False)
+                if data:
+                    final_url = cached_url
+                    if modified:
+                        final_page = page
+            except Exception:
+                data = {}
+
+        # Try initial guess and fallbacks; resolve real detail page if needed
+        candidates = [
+            detail_url_for_cardno(cardno),
+            f"{SEARCH_URL}?{urlencode({'cardno': cardno, 'class[]': 'all'}, doseq=True)}",
+        ]
+        if not data:
+            for u in candidates:
                 try:
-                    soup = get_soup(s, nxt)
-                    u = nxt
+                    page = await _get(u)
                 except Exception:
-                    pass
-        data = extract_details_from_detail_page(soup)
-        if data:  # got something
-            final_url = u
-            break
-
-    if not data:
-        # Last resort: hit the first candidate and attempt extraction anyway
-        u = candidates[0]
-        try:
-            soup = get_soup(s, u)
-            data = extract_details_from_detail_page(soup)
-            final_url = u
-        except Exception:
-            data = {}
+                    continue
+                # Parsing runs in the executor so it overlaps with in-flight requests
+                data, nxt = await loop.run_in_executor(executor, _parse_detail_html, page, u, cardno)
+                if nxt:
+                    try:
+                        page = await _get(nxt)
+                        u = nxt
+                    except Exception:
+                        pass
+                    data, _ = await loop.run_in_executor(executor, _parse_detail_html, page, u, cardno, False)
+                if data:  # got something
+                    final_url = u
+                    final_page = page
+                    break
+
+        if not data:
+            # Last resort: attempt extraction from the first candidate anyway
+            # (reuses the page from the loop above unless fetching it failed there)
+            u = candidates[0]
+            try:
+                page = await _get(u)
+                data, _ = await loop.run_in_executor(executor, _parse_detail_html, page, u, cardno, False)
+            except Exception:
+                data = {}
             final_url = u
 
-    data.setdefault("cardno", cardno)
-    if final_url:
-        data.setdefault("url", final_url)
-    # Be polite
-    time.sleep(delay)
+        if etags and final_url and final_page:
+            etags.put(cardno, final_url, final_page)
+        data.setdefault("cardno", cardno)
+        if final_url:
+            data.setdefault("url", final_url)
+        # Be polite: hold the slot for a while before the next card reuses it
+        await asyncio.sleep(delay)
     return data
 
 
-def write_tsv(rows: Iterable[Dict[str, str]], out_path: str) -> None:
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=CANON_COLS, delimiter="\t", extrasaction="ignore")
-        w.writeheader()
+def iter_card_details(
+    cardnos: List[str],
+    *,
+    delay: float = 0.6,
+    concurrency: int = 8,
+    workers: Optional[int] = None,
+    etags: Optional[ETagStore] = None,
+) -> Iterator[Tuple[str, Optional[Dict[str, str]]]]:
+    """Fetch and parse detail pages concurrently, yielding (cardno, row) in `cardnos` order.
+
+    All cards are scheduled up front (at most `concurrency` in flight) on a private event
+    loop, and each row is yielded as soon as it and every earlier card are done, so callers
+    can stream output. HTML is parsed in a pool of `workers` processes (default: CPU count)
+    so parsing is not serialized by the GIL. With `etags`, pages from earlier runs are
+    fetched conditionally. row is None if the card failed.
+    """
+    loop = asyncio.new_event_loop()
+    # Workers start lazily, once the loop and aiohttp's resolver threads are running, so
+    # never fork this process; forkserver children come from a clean single-threaded server
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _open_session() -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+        timeout = aiohttp.ClientTimeout(total=15)
+        return aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout)
+
+    session = loop.run_until_complete(_open_session())
+    # Tasks are dropped as soon as their row is yielded, so finished rows are not retained
+    tasks = deque(
+        (cn, loop.create_task(fetch_detail(session, cn, sem, delay=delay, executor=pool, etags=etags)))
+        for cn in cardnos
+    )
+    try:
+        while tasks:
+            cn, task = tasks[0]
+            try:
+                row: Optional[Dict[str, str]] = loop.run_until_complete(task)
+            except Exception as e:
+                print(f"[warn] detail {cn}: {e}", file=sys.stderr)
+                row = None
+            # Popped only once finished, so an interrupted task is still cancelled below
+            tasks.popleft()
+            yield cn, row
+    finally:
+        # Also reached when the consumer stops early (e.g. Ctrl-C while writing)
+        pending = [task for _, task in tasks]
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(session.close())
+        loop.close()
+        pool.shutdown(cancel_futures=True)
+
+
+def load_checkpoint(path: str) -> Dict[str, Dict[str, str]]:
+    """Load finished rows from a checkpoint file (JSON lines of [cardno, row])."""
+    done: Dict[str, Dict[str, str]] = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                cn, row = json.loads(line)
+            except ValueError:
+                # Tolerate a partially written last line from an interrupted run
+                continue
+            done[cn] = row
+    return done
+
+
+def append_checkpoint(f, cardno: str, row: Dict[str, str]) -> None:
+    # Only record cards that yielded data so failures are retried on resume
+    if row.keys() - {"cardno", "url"}:
+        f.write(json.dumps([cardno, row], ensure_ascii=False) + "\n")
+        f.flush()
+
+
+def write_tsv(rows: Iterable[Dict[str, str]], out_path: str, *, flush_every: int = 100) -> int:
+    """Write rows as they are produced and return how many were written.
+
+    The file is flushed periodically so an interrupted run still leaves partial output.
+    """
+    n = 0
+    cols = CANON_COLS  # local for the per-row loop
+    with open(out_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f, delimiter="\t")
+        w.writerow(cols)
         for row in rows:
-            # Ensure all keys present
-            out = {k: row.get(k, "") for k in CANON_COLS}
-            w.writerow(out)
+            # Project straight to a list in column order; missing keys become ""
+            w.writerow([row.get(k, "") for k in cols])
+            n += 1
+            if n % flush_every == 0:
+                f.flush()
+    return n
 
 
 def main():
@@ -584,13 +975,29 @@ def main():
 
     p = argparse.ArgumentParser(description="Scrape Shadowverse EVOLVE card data to TSV")
     p.add_argument("--out", default="cards.tsv", help="Output TSV path")
-    p.add_argument("--delay", type=float, default=0.6, help="Delay seconds between requests")
+    p.add_argument("--delay", type=float, default=0.6, help="Delay seconds between requests (listing crawl adapts it to server load)")
     p.add_argument(
         "--only-expansion",
         action="append",
         default=None,
         help="Limit scraping to specific expansion code(s) (e.g., BP16). Can be repeated.")
     p.add_argument("--limit", type=int, default=0, help="Limit number of cards for quick test")
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Max number of detail pages fetched in parallel.",
+    )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Bypass the on-disk HTTP cache ({CACHE_PATH}) and stored detail-page ETags ({ETAG_DB_PATH}).",
+    )
+    p.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Record finished cards to this file and skip them when re-run (resume).",
+    )
     p.add_argument(
         "--search-url",
         action="append",
@@ -610,14 +1017,18 @@ def main():
         help="Max number of duplicate/no-cardno samples to print during inspection.",
     )
     args = p.parse_args()
+    if args.concurrency < 1:
+        p.error("--concurrency must be at least 1")
     start_ts = time.time()
 
-    s = session_with_retries()
+    s = session_with_retries(cache_path=None if args.no_cache else CACHE_PATH)
+    # One pacer for the whole listing crawl so the learned delay carries across URLs
+    pace = AdaptiveDelay(args.delay)
 
     # Diagnostic mode: inspect and exit
     if args.inspect_search:
         for u in args.inspect_search:
-            info = inspect_search_url(s, u, delay=args.delay, sample=args.inspect_limit)
+            info = inspect_search_url(s, u, delay=pace, sample=args.inspect_limit)
             print(f"[inspect] URL: {info['url']}")
             print(f"[inspect] Pages scanned: {info['pages']}")
             dups = info.get('duplicates', []) or []
@@ -645,12 +1056,12 @@ def main():
     cardnos: Set[str] = set()
     if args.search_url:
         for u in args.search_url:
-            cardnos |= crawl_cardnos_from_search_url(s, u, delay=args.delay)
+            cardnos |= crawl_cardnos_from_search_url(s, u, delay=pace)
     if args.only_expansion:
         for exp in args.only_expansion:
-            cardnos |= crawl_cardnos_for_expansion(s, exp, delay=args.delay)
+            cardnos |= crawl_cardnos_for_expansion(s, exp, delay=pace)
     if not args.search_url and not args.only_expansion:
-        cardnos = crawl_all_cardnos(s, delay=args.delay)
+        cardnos = crawl_all_cardnos(s, delay=pace)
 
     if not cardnos:
         print("No card numbers found. The site layout may have changed.", file=sys.stderr)
@@ -658,30 +1069,50 @@ def main():
 
     print(f"Found {len(cardnos)} cards. Fetching details...")
 
-    rows: List[Dict[str, str]] = []
-    for i, cn in enumerate(sorted(cardnos)):
-        if args.limit and i >= args.limit:
-            break
-        try:
-            row = scrape_card_detail(s, cn, delay=args.delay)
-            rows.append(row)
-        except Exception as e:
-            print(f"[warn] detail {cn}: {e}", file=sys.stderr)
-
-    # De-duplicate by (name, kind), keeping the first occurrence.
-    # Since rows are built in cardno ASCII ascending order, the kept one
-    # is the lexicographically smallest by current ordering.
-    uniq_rows: List[Dict[str, str]] = []
-    seen_name_kind: Set[tuple] = set()
-    for r in rows:
-        key = (r.get("name", ""), r.get("kind", ""))
-        if key in seen_name_kind:
-            continue
-        seen_name_kind.add(key)
-        uniq_rows.append(r)
-
-    write_tsv(uniq_rows, args.out)
-    print(f"Wrote {len(uniq_rows)} records to {args.out}")
+    targets = sorted(cardnos)
+    if args.limit:
+        targets = targets[: args.limit]
+
+    done: Dict[str, Dict[str, str]] = {}
+    if args.checkpoint:
+        done = load_checkpoint(args.checkpoint)
+        if done:
+            print(f"Resuming: {sum(cn in done for cn in targets)} cards already in {args.checkpoint}")
+    pending = [cn for cn in targets if cn not in done]
+
+    ckpt_f = open(args.checkpoint, "a", encoding="utf-8") if args.checkpoint else None
+    etags = None if args.no_cache else ETagStore(ETAG_DB_PATH)
+    fetched = iter_card_details(pending, delay=args.delay, concurrency=args.concurrency, etags=etags)
+
+    def _unique_rows() -> Iterator[Dict[str, str]]:
+        # De-duplicate by (name, kind), keeping the first occurrence.
+        # Since rows arrive in cardno ASCII ascending order, the kept one
+        # is the lexicographically smallest by current ordering.
+        seen_name_kind: Set[tuple] = set()
+        for cn in targets:
+            if cn in done:
+                row = done[cn]
+            else:
+                _, row = next(fetched)
+                if row is None:
+                    continue
+                if ckpt_f:
+                    append_checkpoint(ckpt_f, cn, row)
+            key = (row.get("name", ""), row.get("kind", ""))
+            if key in seen_name_kind:
+                continue
+            seen_name_kind.add(key)
+            yield row
+
+    try:
+        written = write_tsv(_unique_rows(), args.out)
+    finally:
+        fetched.close()
+        if etags:
+            etags.close()
+        if ckpt_f:
+            ckpt_f.close()
+    print(f"Wrote {written} records to {args.out}")
     elapsed = time.time() - start_ts
     print(f"Elapsed time: {elapsed:.2f}s")
 